@@ -1,7 +1,22 @@
+from fastapi import Request
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
+    # Database, any SQLAlchemy URL ("sqlite://" for in-memory)
+    DATABASE_URL: str = "sqlite:///./course_manager.db"
+    # Create the tables when the app is built, needed for in-memory databases.
+    # File or server databases are migrated with `python -m app.migrate`.
+    CREATE_SCHEMA: bool = False
+
+    # Background job that zeroes missed deadlines
+    SCHEDULER_ENABLED: bool = True
+    DEADLINE_CHECK_INTERVAL_SECONDS: int = 60
+
+    # Student dashboard cache, per worker process (0 disables it)
+    DASHBOARD_CACHE_SECONDS: int = 60
+    DASHBOARD_CACHE_MAX_ENTRIES: int = 10000
+
     # Key settings for JWT
     SECRET_KEY: str = 
     ALGORITHM: str = "HS256"
@@ -15,4 +30,9 @@ class Settings(BaseSettings):
     MAIL_SERVER: str = "smtp.gmail.com"
 
 
-settings = Settings()
\ No newline at end of file
+settings = Settings()
+
+
+def get_settings(request: Request) -> Settings:
+    # settings of the app handling the request, see create_app()
+    return request.app.state.settings
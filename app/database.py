@@ -1,20 +1,38 @@
+from fastapi import Request
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
-
-# Using SQLite
-SQLALCHEMY_DATABASE_URL = "sqlite:///./course_manager.db"
-
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+from sqlalchemy.pool import StaticPool
 
 class Base(DeclarativeBase):
     pass
 
-def get_db():
-    db = SessionLocal()
+def make_engine(database_url: str):
+    connect_args = {}
+    kwargs = {}
+    if database_url.startswith("sqlite"):
+        connect_args["check_same_thread"] = False
+        # in-memory database lives in a single connection, share it between sessions
+        if is_in_memory(database_url):
+            kwargs["poolclass"] = StaticPool
+
+    return create_engine(database_url, connect_args=connect_args, **kwargs)
+
+def make_session_factory(engine, info: dict = None):
+    # info is copied into every session's Session.info (e.g. the app's dashboard cache)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine, info=info)
+
+def is_in_memory(database_url: str) -> bool:
+    return database_url in ("sqlite://", "sqlite:///:memory:")
+
+def create_tables(engine):
+    # Migration step, see app/migrate.py
+    from . import models  # noqa: F401 (registers the tables on Base.metadata)
+    Base.metadata.create_all(bind=engine)
+
+def get_db(request: Request):
+    # every app built by create_app() has its own engine and session factory
+    db = request.app.state.SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
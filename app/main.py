@@ -1,20 +1,16 @@
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
-from apscheduler.schedulers.background import BackgroundScheduler
 from contextlib import asynccontextmanager
-from .database import engine, Base, SessionLocal
-from .routers import auth, courses, students
-from .services.course_service import CourseService
-from fastapi_cache import FastAPICache
-from fastapi_cache.backends.inmemory import InMemoryBackend
-
-# Creating all tables in database (One time operation)
-Base.metadata.create_all(bind=engine)
+from uuid import uuid4
+from .config import Settings, settings as default_settings
+from .database import make_engine, make_session_factory, create_tables
 
 # --- Scheduled Task ---
-def scheduled_deadline_checker():
+def scheduled_deadline_checker(session_factory):
+    from .services.course_service import CourseService
+
     # New database session for the scheduled task
-    db = SessionLocal()
+    db = session_factory()
     try:
         CourseService.check_missed_deadlines(db)
     except Exception as e:
@@ -22,34 +18,81 @@ def scheduled_deadline_checker():
     finally:
         db.close()
 
-scheduler = BackgroundScheduler()
-scheduler.add_job(scheduled_deadline_checker, 'interval', seconds=60)
 
+def create_app(settings: Settings = None) -> FastAPI:
+    """Build the API for the given settings.
+
+    Each app owns its engine, session factory, dashboard cache and settings on app.state, so several
+    apps can live in one process. Database, schema, scheduler, dashboard cache and JWT settings come
+    from `settings`; the mail settings are still read from the process-wide app.config.settings.
+    Routers, services and APScheduler are imported here, jose and passlib on first use.
+    """
+    settings = settings or default_settings
+    from .responses import FastJSONResponse
+    from .services.dashboard_service import DashboardCache
+
+    engine = make_engine(settings.DATABASE_URL)
+    if settings.CREATE_SCHEMA:
+        create_tables(engine)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        from fastapi_cache import FastAPICache
+        from fastapi_cache.backends.inmemory import InMemoryBackend
+
+        # Initialize cache
+        FastAPICache.init(InMemoryBackend(), prefix="fastapi-cache")
+
+        scheduler = None
+        if settings.SCHEDULER_ENABLED:
+            # APScheduler is only needed by a running server
+            from apscheduler.schedulers.background import BackgroundScheduler
+
+            scheduler = BackgroundScheduler()
+            scheduler.add_job(scheduled_deadline_checker, 'interval', seconds=settings.DEADLINE_CHECK_INTERVAL_SECONDS,
+                              args=[app.state.SessionLocal])
+            scheduler.start()
+        yield
+        if scheduler:
+            scheduler.shutdown()
+
+    app = FastAPI(lifespan=lifespan, title="Student Course Manager", default_response_class=FastJSONResponse)
+    app.state.settings = settings
+    app.state.engine = engine
+    app.state.dashboard_cache = DashboardCache(settings.DASHBOARD_CACHE_SECONDS, settings.DASHBOARD_CACHE_MAX_ENTRIES)
+    # services invalidate the cache through the session, see DashboardService.cache_for
+    app.state.SessionLocal = make_session_factory(engine, info={"dashboard_cache": app.state.dashboard_cache})
+    # part of every fastapi-cache key, see responses.path_key_builder
+    app.state.cache_namespace = uuid4().hex
+
+    # --- Global Exception Handler ---
+    @app.exception_handler(Exception)
+    async def global_exception_handler(request: Request, exc: Exception):
+        return JSONResponse(
+            status_code=500,
+            content={"message": "Global Error Handler Caught this", "details": str(exc)},
+        )
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    # Initialize cache
-    FastAPICache.init(InMemoryBackend(), prefix="fastapi-cache")
+    # --- Include Routers ---
+    from .routers import auth, courses, students
+    app.include_router(auth.router)
+    app.include_router(courses.router)
+    app.include_router(students.router)
 
-    scheduler.start()
-    yield
-    scheduler.shutdown()
+    @app.get("/")
+    def start_point():
+        return {"message": "Welcome to Course Management API"}
 
-app = FastAPI(lifespan=lifespan, title="Student Course Manager")
+    return app
 
-# --- Global Exception Handler ---
-@app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception):
-    return JSONResponse(
-        status_code=500,
-        content={"message": "Global Error Handler Caught this", "details": str(exc)},
-    )
 
-# --- Include Routers ---
-app.include_router(auth.router)
-app.include_router(courses.router)
-app.include_router(students.router)
+_default_app = None
 
-@app.get("/")
-def start_point():
-    return {"message": "Welcome to Course Management API"}
\ No newline at end of file
+def __getattr__(name):
+    # `app` is built on first access (e.g. by `uvicorn app.main:app`), not when the module is imported
+    global _default_app
+    if name == "app":
+        if _default_app is None:
+            _default_app = create_app()
+        return _default_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
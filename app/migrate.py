@@ -0,0 +1,26 @@
+"""Create the database schema.
+
+Usage: python -m app.migrate
+The URL is taken from the DATABASE_URL setting (environment or .env).
+An in-memory database ("sqlite://") only exists inside one process, so it
+cannot be migrated from here; start the API with CREATE_SCHEMA=true instead.
+"""
+from .config import settings
+from .database import make_engine, create_tables, is_in_memory
+
+
+def migrate(database_url: str = None):
+    database_url = database_url or settings.DATABASE_URL
+    if is_in_memory(database_url):
+        raise SystemExit("In-memory databases cannot be migrated separately, set CREATE_SCHEMA=true for the API")
+
+    engine = make_engine(database_url)
+    try:
+        create_tables(engine)
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    migrate()
+    print(f"--- [MIGRATE] Tables created for {settings.DATABASE_URL} ---")
@@ -0,0 +1,79 @@
+import orjson
+from typing import Any, Type
+from fastapi.responses import JSONResponse
+from fastapi_cache.coder import JsonCoder
+from pydantic import BaseModel, TypeAdapter
+from .schemas import CourseResponse, AssignmentResponse, StudentResponse, GradeResponse, StudentDashboard
+
+
+class FastJSONResponse(JSONResponse):
+    """Default response class, encodes with orjson instead of json.dumps."""
+
+    def render(self, content) -> bytes:
+        # already serialized by one of the adapters below
+        if isinstance(content, bytes):
+            return content
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONCoder(JsonCoder):
+    """fastapi-cache coder that dumps response models with pydantic-core instead of jsonable_encoder."""
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        if isinstance(value, BaseModel):
+            return value.__pydantic_serializer__.to_json(value)
+        return super().encode(value)
+
+    @classmethod
+    def decode_as_type(cls, value: bytes, *, type_: Any) -> Any:
+        # cache hit: parse straight back into the endpoint's return model in pydantic-core
+        if isinstance(type_, type) and issubclass(type_, BaseModel):
+            return type_.model_validate_json(value)
+        return orjson.loads(value)
+
+
+def path_key_builder(func, namespace: str = "", *, request=None, response=None, args=(), kwargs=None) -> str:
+    """fastapi-cache key from the app, the endpoint and the request URL.
+
+    The default key includes every argument, and the db session and current user
+    differ on each request, so the cache would never hit. Auth dependencies still
+    run before the cache is checked. The in-memory backend is shared by every app
+    in the process, so the app's cache_namespace keeps their entries apart.
+    """
+    return (f"{namespace}:{request.app.state.cache_namespace}:{func.__module__}:{func.__name__}:"
+            f"{request.url.path}?{request.query_params}")
+
+
+# --- Precompiled serializers ---
+# Rows coming from our own database are already valid, so they are copied into
+# the response models with model_construct() (no validation, no EmailStr checks)
+# and dumped straight to JSON bytes by pydantic-core.
+course_adapter = TypeAdapter(CourseResponse)
+grade_adapter = TypeAdapter(GradeResponse)
+dashboard_adapter = TypeAdapter(StudentDashboard)
+
+
+def _construct(model: Type[BaseModel], row, **nested) -> BaseModel:
+    data = {name: getattr(row, name) for name in model.model_fields if name not in nested}
+    data.update(nested)
+    return model.model_construct(**data)
+
+
+def course_model(course) -> CourseResponse:
+    # returned from cached endpoints instead of a Response, so fastapi-cache can still set its headers;
+    # FastAPI accepts the instance as is for response_model without validating it again
+    return _construct(
+        CourseResponse,
+        course,
+        assignments=[_construct(AssignmentResponse, a) for a in course.assignments],
+        students=[_construct(StudentResponse, s) for s in course.students],
+    )
+
+
+def grade_response(grade) -> FastJSONResponse:
+    return FastJSONResponse(grade_adapter.dump_json(_construct(GradeResponse, grade)))
+
+
+def dashboard_response(dashboard: StudentDashboard) -> FastJSONResponse:
+    return FastJSONResponse(dashboard_adapter.dump_json(dashboard))
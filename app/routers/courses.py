@@ -5,6 +5,7 @@ from ..schemas import CourseCreate, CourseResponse, AssignmentCreate
 from ..models import User
 from ..services.course_service import CourseService
 from ..services.auth_service import get_current_user
+from ..responses import course_model, FastJSONCoder, path_key_builder
 from fastapi_cache.decorator import cache
 
 router = APIRouter(prefix="/courses", tags=["Courses"])
@@ -34,13 +35,13 @@ def delete_assignment(
     return CourseService.delete_assignment(db, assignment_id)
 
 @router.get("/{course_id}", response_model=CourseResponse)
-@cache(expire=60)
+@cache(expire=60, coder=FastJSONCoder, key_builder=path_key_builder)
 async def read_course(
     course_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user) # Only User can delete
-):
-    return CourseService.get_course(db, course_id)
+) -> CourseResponse:
+    return course_model(CourseService.get_course(db, course_id))
 
 @router.post("/{course_id}/assignments/")
 def add_assignment(
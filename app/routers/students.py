@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
+from ..config import Settings, get_settings
 from ..database import get_db
-from ..schemas import GradeCreate, StudentCreate, StudentResponse, GradeResponse, SubmissionCreate, StudentLogin, Token
+from ..schemas import GradeCreate, StudentCreate, StudentResponse, GradeResponse, SubmissionCreate, StudentLogin, Token, StudentDashboard
 from ..models import User, Student
 from ..services.course_service import CourseService
+from ..services.dashboard_service import DashboardService
 from ..services.auth_service import get_current_user, get_password_hash, verify_password, create_access_token, get_current_student
+from ..responses import grade_response, dashboard_response
 
 router = APIRouter(tags=["Students & Grades"])
 
@@ -34,15 +37,29 @@ def create_student(
 
 
 @router.post("/students/login", response_model=Token)
-def login_student(login_data: StudentLogin, db: Session = Depends(get_db)):
+def login_student(
+    login_data: StudentLogin,
+    db: Session = Depends(get_db),
+    settings: Settings = Depends(get_settings),
+):
     student = db.query(Student).filter(Student.email == login_data.email).first()
     if not student or not verify_password(login_data.password, student.hashed_password):
         raise HTTPException(status_code=400, detail="Incorrect email or password")
 
     # create JWT token for student where "sub" is student email
-    access_token = create_access_token(data={"sub": student.email})
+    access_token = create_access_token(data={"sub": student.email}, settings=settings)
     return {"access_token": access_token, "token_type": "bearer"}
 
+@router.get("/students/me/dashboard", response_model=StudentDashboard)
+def read_dashboard(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_student: Student = Depends(get_current_student)
+):
+    # course, assignments, grades and totals in one call, cached per student in this app
+    return dashboard_response(
+        DashboardService.get_dashboard(db, current_student, request.app.state.dashboard_cache))
+
 @router.delete("/students/{student_id}")
 def delete_student(
     student_id: int,
@@ -78,5 +95,5 @@ def grade_student(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    return CourseService.grade_student(db, grade)
+    return grade_response(CourseService.grade_student(db, grade))
 
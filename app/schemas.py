@@ -88,3 +88,27 @@ class GradeResponse(GradeCreate):
 
     class Config:
         from_attributes = True
+
+# --- Dashboard Schemas ---
+class DashboardAssignment(BaseModel):
+    id: int
+    title: str
+    type: str
+    max_score: int
+    deadline: datetime
+    penalty_points: int
+    score: Optional[float] = None
+    submitted_at: Optional[datetime] = None
+    is_late: bool = False
+    missed: bool = False
+
+class StudentDashboard(BaseModel):
+    student: StudentResponse
+    course_id: int
+    course_title: str
+    max_lab_points: int
+    max_exam_points: int
+    lab_total: float
+    exam_total: float
+    total: float
+    assignments: List[DashboardAssignment] = []
@@ -3,6 +3,7 @@ from fastapi import HTTPException
 from ..models import Course, Assignment, Student, Grade
 from ..schemas import CourseCreate, AssignmentCreate, GradeCreate, SubmissionCreate
 from .email_service import send_email_notification
+from .dashboard_service import DashboardService
 from datetime import datetime, timezone
 
 
@@ -44,6 +45,7 @@ class CourseService:
         db_assign = Assignment(**assignment.model_dump(), course_id=course_id)
         db.add(db_assign)
         db.commit()
+        DashboardService.clear(db)
         db.refresh(db_assign)
 
         return db_assign
@@ -70,6 +72,7 @@ class CourseService:
             existing_submission.submitted_at = datetime.now(timezone.utc)
             existing_submission.student_answer = submission.answer_text
             db.commit()
+            DashboardService.invalidate(db, student_id)
             db.refresh(existing_submission)
             return existing_submission
 
@@ -83,6 +86,7 @@ class CourseService:
         )
         db.add(db_submission)
         db.commit()
+        DashboardService.invalidate(db, student_id)
         db.refresh(db_submission)
         return db_submission
 
@@ -135,6 +139,7 @@ class CourseService:
         # Saving final score
         submission.score = final_score
         db.commit()
+        DashboardService.invalidate(db, student.id)
         db.refresh(submission)
 
         # send email notification
@@ -158,6 +163,7 @@ class CourseService:
 
         db.delete(course)
         db.commit()
+        DashboardService.clear(db)
 
         return {"msg": "Course deleted"}
 
@@ -173,6 +179,7 @@ class CourseService:
         # delete assignment (grades will be deleted due to cascade)
         db.delete(assignment)
         db.commit()
+        DashboardService.clear(db)
 
         return {"msg": "Assignment and associated grades deleted"}
 
@@ -186,6 +193,7 @@ class CourseService:
         # delete student (grades will be deleted due to cascade)
         db.delete(student)
         db.commit()
+        DashboardService.invalidate(db, student_id)
 
         return {"msg": "Student and associated grades deleted"}
 
@@ -195,6 +203,7 @@ class CourseService:
 
         now = datetime.now(timezone.utc)
         expired_assignments = db.query(Assignment).filter(Assignment.deadline < now).all()
+        missed_students = set()
 
         for assignment in expired_assignments:
             students = db.query(Student).filter(Student.course_id == assignment.course_id).all()
@@ -217,5 +226,8 @@ class CourseService:
                         submitted_at=now
                     )
                     db.add(zero_grade)
+                    missed_students.add(student.id)
 
-        db.commit()
\ No newline at end of file
+        db.commit()
+        for student_id in missed_students:
+            DashboardService.invalidate(db, student_id)
\ No newline at end of file
@@ -0,0 +1,168 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, List, Optional
+from sqlalchemy import and_
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from ..models import Course, Assignment, Grade, Student
+from ..schemas import StudentDashboard, DashboardAssignment, StudentResponse
+from datetime import datetime, timezone
+
+
+def _as_utc(value: datetime):
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class DashboardCache:
+    """LRU cache of student dashboards, one per app (see create_app).
+
+    It lives in the worker process: invalidations only reach the worker that handled the write,
+    other workers keep serving their copy until it expires (expire_seconds, 0 disables the cache).
+    """
+
+    def __init__(self, expire_seconds: int, max_entries: int):
+        self.expire_seconds = expire_seconds
+        self.max_entries = max_entries
+        # student_id -> (expires_at, StudentDashboard)
+        self._entries = OrderedDict()
+        # student_id -> token of the build in flight; invalidate() drops it so a dashboard
+        # built from data read before the change is not stored
+        self._pending = {}
+        # also used by the scheduler thread
+        self._lock = Lock()
+
+    def get_or_build(self, student_id: int, build: Callable[[], StudentDashboard]) -> StudentDashboard:
+        if self.expire_seconds <= 0:
+            return build()
+
+        now = time.monotonic()
+        token = object()
+        with self._lock:
+            cached = self._entries.get(student_id)
+            if cached and cached[0] > now:
+                self._entries.move_to_end(student_id)
+                return cached[1]
+            self._pending[student_id] = token
+
+        try:
+            dashboard = build()
+        except Exception:
+            with self._lock:
+                if self._pending.get(student_id) is token:
+                    del self._pending[student_id]
+            raise
+
+        with self._lock:
+            if self._pending.get(student_id) is token:
+                del self._pending[student_id]
+                self._entries[student_id] = (now + self.expire_seconds, dashboard)
+                self._entries.move_to_end(student_id)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return dashboard
+
+    def student_ids(self) -> List[int]:
+        # least recently used first
+        with self._lock:
+            return list(self._entries)
+
+    def invalidate(self, student_id: int):
+        with self._lock:
+            self._pending.pop(student_id, None)
+            self._entries.pop(student_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._pending.clear()
+            self._entries.clear()
+
+
+class DashboardService:
+    @staticmethod
+    def get_dashboard(db: Session, student: Student, cache: Optional[DashboardCache] = None) -> StudentDashboard:
+        if cache is None:
+            return DashboardService._build_dashboard(db, student)
+        return cache.get_or_build(student.id, lambda: DashboardService._build_dashboard(db, student))
+
+    @staticmethod
+    def cache_for(db: Session) -> Optional[DashboardCache]:
+        # sessions made by an app's session factory carry that app's cache
+        return db.info.get("dashboard_cache")
+
+    @staticmethod
+    def invalidate(db: Session, student_id: int):
+        cache = DashboardService.cache_for(db)
+        if cache is not None:
+            cache.invalidate(student_id)
+
+    @staticmethod
+    def clear(db: Session):
+        # used when assignments or courses change, which touches every student of a course
+        cache = DashboardService.cache_for(db)
+        if cache is not None:
+            cache.clear()
+
+    @staticmethod
+    def _build_dashboard(db: Session, student: Student) -> StudentDashboard:
+        if student.course_id is None:
+            raise HTTPException(status_code=404, detail="Student is not enrolled in a course")
+
+        # one query: course + every assignment + this student's grade for it (if any)
+        rows = db.query(Course, Assignment, Grade) \
+            .select_from(Course) \
+            .outerjoin(Assignment, Assignment.course_id == Course.id) \
+            .outerjoin(Grade, and_(Grade.assignment_id == Assignment.id, Grade.student_id == student.id)) \
+            .filter(Course.id == student.course_id) \
+            .order_by(Assignment.deadline, Assignment.id) \
+            .all()
+        if not rows:
+            raise HTTPException(status_code=404, detail="Course not found")
+
+        course = rows[0][0]
+        now = datetime.now(timezone.utc)
+        totals = {"lab": 0.0, "exam": 0.0}
+        assignments = []
+
+        for _, assignment, grade in rows:
+            if assignment is None:  # course without assignments
+                continue
+
+            deadline = _as_utc(assignment.deadline)
+            submitted_at = _as_utc(grade.submitted_at) if grade else None
+            score = grade.score if grade else None
+
+            # zero grades written by the deadline sweep are missed, not late
+            missed = deadline < now and (grade is None or grade.student_answer == "MISSED DEADLINE")
+            # same rule as grade_student: submitted after the deadline is late
+            is_late = not missed and submitted_at is not None and submitted_at > deadline
+
+            if score is not None:
+                totals[assignment.type] = totals.get(assignment.type, 0.0) + score
+
+            assignments.append(DashboardAssignment(
+                id=assignment.id,
+                title=assignment.title,
+                type=assignment.type,
+                max_score=assignment.max_score,
+                deadline=assignment.deadline,
+                penalty_points=assignment.penalty_points,
+                score=score,
+                submitted_at=grade.submitted_at if grade else None,
+                is_late=is_late,
+                missed=missed,
+            ))
+
+        return StudentDashboard(
+            student=StudentResponse.model_validate(student),
+            course_id=course.id,
+            course_title=course.title,
+            max_lab_points=course.max_lab_points,
+            max_exam_points=course.max_exam_points,
+            lab_total=totals["lab"],
+            exam_total=totals["exam"],
+            total=totals["lab"] + totals["exam"],
+            assignments=assignments,
+        )
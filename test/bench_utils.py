@@ -0,0 +1,55 @@
+# test/bench_utils.py
+"""Helpers shared by the benchmark and query-count tests."""
+import os
+import time
+import statistics
+
+from sqlalchemy import event
+
+BENCH_ROUNDS = int(os.getenv("BENCH_ROUNDS", 20))
+
+# collected by run_benchmark(), printed by the terminal summary hook in conftest.py
+benchmark_results = []
+
+
+class QueryCounter:
+    """Counts SQL statements sent to the engine while active."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    def __enter__(self):
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+def run_benchmark(name, func, rounds=BENCH_ROUNDS):
+    """Call func `rounds` times and record latency percentiles in ms."""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    result = {
+        "name": name,
+        "rounds": rounds,
+        "p50": statistics.median(timings),
+        "p95": timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        "max": timings[-1],
+    }
+    benchmark_results.append(result)
+    return result
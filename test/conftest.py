@@ -0,0 +1,86 @@
+# test/conftest.py
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+from app.config import Settings
+from app.main import create_app
+from app.services.auth_service import create_access_token
+from bench_utils import benchmark_results
+from data_generator import generate_dataset
+
+# Scale of the benchmark dataset, override from the environment for bigger runs:
+#   BENCH_STUDENTS=2000 BENCH_COURSES=10 BENCH_LABS=40 BENCH_EXAMS=10 pytest test/test_benchmarks.py -s
+BENCH_SCALE = {
+    "courses": int(os.getenv("BENCH_COURSES", 2)),
+    "students_per_course": int(os.getenv("BENCH_STUDENTS", 20)),
+    "labs_per_course": int(os.getenv("BENCH_LABS", 4)),
+    "exams_per_course": int(os.getenv("BENCH_EXAMS", 1)),
+}
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: latency micro-benchmarks on a synthetic dataset")
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not benchmark_results:
+        return
+    terminalreporter.section("benchmarks (ms)")
+    terminalreporter.write_line(f"{'name':<40}{'rounds':>8}{'p50':>10}{'p95':>10}{'max':>10}")
+    for r in benchmark_results:
+        terminalreporter.write_line(
+            f"{r['name']:<40}{r['rounds']:>8}{r['p50']:>10.2f}{r['p95']:>10.2f}{r['max']:>10.2f}"
+        )
+
+
+@pytest.fixture
+def api():
+    # fresh in-memory database for every test, no scheduler
+    api = create_app(Settings(DATABASE_URL="sqlite://", CREATE_SCHEMA=True, SCHEDULER_ENABLED=False))
+    yield api
+    api.state.engine.dispose()
+
+
+@pytest.fixture
+def engine(api):
+    return api.state.engine
+
+
+@pytest.fixture
+def db(api):
+    session = api.state.SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def dataset(db):
+    return generate_dataset(db, **BENCH_SCALE)
+
+
+@pytest.fixture(autouse=True)
+def no_emails(monkeypatch):
+    # grading sends a real SMTP email otherwise
+    monkeypatch.setattr("app.services.course_service.send_email_notification", lambda *args: None)
+
+
+@pytest.fixture
+def client(api):
+    FastAPICache.init(InMemoryBackend(), prefix="fastapi-cache")
+    return TestClient(api)
+
+
+@pytest.fixture
+def teacher_headers(dataset):
+    token = create_access_token(data={"sub": dataset.teacher_username})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def student_headers(dataset):
+    token = create_access_token(data={"sub": dataset.student_emails[0]})
+    return {"Authorization": f"Bearer {token}"}
@@ -0,0 +1,184 @@
+# test/data_generator.py
+"""Seeded synthetic data for benchmarks and load tests.
+
+Usage (fills a database file for the HTTP load driver):
+    python test/data_generator.py --db sqlite:///./bench.db --courses 10 --students 2000 --labs 40 --exams 10
+That is 10 * 2000 * 50 = 1,000,000 grades at --grade-ratio 1.0.
+"""
+import argparse
+import random
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.models import User, Course, Student, Assignment, Grade  # noqa: E402
+from app.services.auth_service import get_password_hash  # noqa: E402
+
+DEFAULT_PASSWORD = "bench-password"
+TEACHER_USERNAME = "bench_teacher"
+
+# Rows per INSERT batch, keeps memory flat when generating ~1M grades
+BATCH_SIZE = 20_000
+
+
+@dataclass
+class Dataset:
+    """Ids of generated rows, used by benchmarks to pick targets."""
+    teacher_username: str
+    password: str
+    course_ids: List[int] = field(default_factory=list)
+    student_ids: List[int] = field(default_factory=list)
+    student_emails: List[str] = field(default_factory=list)
+    assignment_ids: List[int] = field(default_factory=list)
+    grade_count: int = 0
+
+
+def _insert_batched(db: Session, model, rows: list):
+    for start in range(0, len(rows), BATCH_SIZE):
+        db.execute(insert(model), rows[start:start + BATCH_SIZE])
+
+
+def generate_dataset(
+    db: Session,
+    courses: int = 2,
+    students_per_course: int = 20,
+    labs_per_course: int = 4,
+    exams_per_course: int = 1,
+    grade_ratio: float = 0.8,
+    past_deadline_ratio: float = 0.5,
+    seed: int = 42,
+) -> Dataset:
+    """Fill the database with courses, students, assignments and grades.
+
+    The same seed always produces the same data. Passwords are hashed once
+    and shared by every account, bcrypt is far too slow to run per row.
+    """
+    if not 1 <= labs_per_course <= 40 or not 1 <= exams_per_course <= 60:
+        raise ValueError("labs_per_course must be in 1..40 and exams_per_course in 1..60")
+
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    hashed_pwd = get_password_hash(DEFAULT_PASSWORD)
+    dataset = Dataset(teacher_username=TEACHER_USERNAME, password=DEFAULT_PASSWORD)
+
+    db.add(User(username=TEACHER_USERNAME, email="bench_teacher@example.com", hashed_password=hashed_pwd))
+
+    course_rows = [
+        {"title": f"Course {c}", "description": f"Synthetic course {c}", "max_lab_points": 40, "max_exam_points": 60}
+        for c in range(courses)
+    ]
+    _insert_batched(db, Course, course_rows)
+    dataset.course_ids = [c.id for c in db.query(Course.id).order_by(Course.id)]
+
+    student_rows = []
+    assignment_rows = []
+    for course_id in dataset.course_ids:
+        for s in range(students_per_course):
+            student_rows.append({
+                "full_name": f"Student {course_id}-{s}",
+                "email": f"student{course_id}_{s}@example.com",
+                "hashed_password": hashed_pwd,
+                "course_id": course_id,
+            })
+
+        # split the formula points evenly so the course stays valid
+        for kind, count, limit in (("lab", labs_per_course, 40), ("exam", exams_per_course, 60)):
+            for a in range(count):
+                days = rng.randint(1, 30)
+                deadline = now - timedelta(days=days) if rng.random() < past_deadline_ratio else now + timedelta(days=days)
+                assignment_rows.append({
+                    "title": f"{kind.capitalize()} {a}",
+                    "type": kind,
+                    "max_score": limit // count,
+                    "deadline": deadline,
+                    "penalty_points": rng.randint(0, 2),
+                    "content": {"question": f"Synthetic {kind} {a}"},
+                    "course_id": course_id,
+                })
+
+    _insert_batched(db, Student, student_rows)
+    _insert_batched(db, Assignment, assignment_rows)
+
+    students = db.query(Student.id, Student.email, Student.course_id).order_by(Student.id).all()
+    assignments = db.query(Assignment.id, Assignment.course_id, Assignment.max_score, Assignment.deadline) \
+        .order_by(Assignment.id).all()
+    dataset.student_ids = [s.id for s in students]
+    dataset.student_emails = [s.email for s in students]
+    dataset.assignment_ids = [a.id for a in assignments]
+
+    assignments_by_course = {}
+    for a in assignments:
+        assignments_by_course.setdefault(a.course_id, []).append(a)
+
+    # grades are streamed in batches instead of built as one big list
+    batch = []
+    for student in students:
+        for a in assignments_by_course.get(student.course_id, []):
+            if rng.random() >= grade_ratio:
+                continue
+            batch.append({
+                "student_id": student.id,
+                "assignment_id": a.id,
+                "score": round(rng.uniform(0, a.max_score), 1),
+                "student_answer": "synthetic answer",
+                "submitted_at": a.deadline - timedelta(hours=rng.randint(-24, 72)),
+            })
+            if len(batch) >= BATCH_SIZE:
+                db.execute(insert(Grade), batch)
+                dataset.grade_count += len(batch)
+                batch = []
+    if batch:
+        db.execute(insert(Grade), batch)
+        dataset.grade_count += len(batch)
+
+    db.commit()
+    return dataset
+
+
+def main():
+    from app.database import make_engine, make_session_factory, create_tables
+
+    parser = argparse.ArgumentParser(description="Generate synthetic course manager data")
+    parser.add_argument("--db", default="sqlite:///./bench.db")
+    parser.add_argument("--courses", type=int, default=10)
+    parser.add_argument("--students", type=int, default=200, help="students per course")
+    parser.add_argument("--labs", type=int, default=8, help="labs per course")
+    parser.add_argument("--exams", type=int, default=2, help="exams per course")
+    parser.add_argument("--grade-ratio", type=float, default=0.8)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    # same engine setup and schema as the API, so any URL it accepts works here
+    engine = make_engine(args.db)
+    create_tables(engine)
+    db = make_session_factory(engine)()
+    try:
+        dataset = generate_dataset(
+            db,
+            courses=args.courses,
+            students_per_course=args.students,
+            labs_per_course=args.labs,
+            exams_per_course=args.exams,
+            grade_ratio=args.grade_ratio,
+            seed=args.seed,
+        )
+    finally:
+        db.close()
+        engine.dispose()
+
+    print(
+        f"Generated {len(dataset.course_ids)} courses, {len(dataset.student_ids)} students, "
+        f"{len(dataset.assignment_ids)} assignments, {dataset.grade_count} grades"
+    )
+    print(f"Teacher login: {dataset.teacher_username} / {dataset.password}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+# test/load_driver.py
+"""HTTP load driver for a running API.
+
+1. Generate data:   python test/data_generator.py --db sqlite:///./course_manager.db
+2. Start the API:   uvicorn app.main:app --workers 4
+3. Drive load:      python test/load_driver.py --url http://127.0.0.1:8000 --requests 2000 --concurrency 16
+
+Reports p50/p95/p99 latency and throughput for every scenario.
+The response and dashboard caches live in each worker, with several workers an
+invalidation only reaches one of them (see DASHBOARD_CACHE_SECONDS).
+POST /grades/ sends a notification email per request, point MAIL_SERVER/MAIL_PORT
+at a local sink (e.g. `python -m aiosmtpd -n -l localhost:1025`) before driving load.
+"""
+import argparse
+import json
+import random
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from data_generator import DEFAULT_PASSWORD, TEACHER_USERNAME
+
+
+def _request(method, url, body=None, headers=None, form=False):
+    headers = dict(headers or {})
+    data = None
+    if body is not None:
+        if form:
+            data = urllib.parse.urlencode(body).encode()
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        else:
+            data = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+
+    req = urllib.request.Request(url, data=data, headers=headers, method=method)
+    try:
+        with urllib.request.urlopen(req) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+def _login(base_url):
+    status, body = _request(
+        "POST", f"{base_url}/token", {"username": TEACHER_USERNAME, "password": DEFAULT_PASSWORD}, form=True
+    )
+    if status != 200:
+        raise SystemExit(f"Teacher login failed ({status}), run test/data_generator.py against the API database first")
+    return {"Authorization": f"Bearer {json.loads(body)['access_token']}"}
+
+
+def _load_targets(base_url, headers, courses, students_per_course, rng):
+    """Student tokens and (student, assignment) pairs taken from the generated courses."""
+    targets = []
+    for course_id in range(1, courses + 1):
+        status, body = _request("GET", f"{base_url}/courses/{course_id}", headers=headers)
+        if status != 200:
+            continue
+        course = json.loads(body)
+        if not course["students"] or not course["assignments"]:
+            continue
+
+        for student in rng.sample(course["students"], min(students_per_course, len(course["students"]))):
+            status, body = _request(
+                "POST", f"{base_url}/students/login", {"email": student["email"], "password": DEFAULT_PASSWORD})
+            if status != 200:
+                continue
+            targets.append({
+                "student_id": student["id"],
+                "email": student["email"],
+                "headers": {"Authorization": f"Bearer {json.loads(body)['access_token']}"},
+                "assignments": course["assignments"],
+            })
+
+    if not targets:
+        raise SystemExit("No students found, run test/data_generator.py against the API database first")
+    return targets
+
+
+def _percentile(sorted_values, pct):
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_scenario(name, call, total, concurrency):
+    def timed(_):
+        start = time.perf_counter()
+        status = call()
+        return (time.perf_counter() - start) * 1000, status
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(timed, range(total)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(r[0] for r in results)
+    errors = sum(1 for r in results if r[1] >= 400)
+    print(
+        f"{name:<28}{total:>8}{errors:>8}"
+        f"{_percentile(latencies, 50):>10.1f}{_percentile(latencies, 95):>10.1f}{_percentile(latencies, 99):>10.1f}"
+        f"{total / elapsed:>12.1f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP load driver for the course manager API")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--requests", type=int, default=1000, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--courses", type=int, default=10, help="course ids to spread reads over")
+    parser.add_argument("--students", type=int, default=5, help="students logged in per course for write scenarios")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    base_url = args.url.rstrip("/")
+    rng = random.Random(args.seed)
+    headers = _login(base_url)
+    targets = _load_targets(base_url, headers, args.courses, args.students, rng)
+
+    def submit():
+        target = rng.choice(targets)
+        assignment = rng.choice(target["assignments"])
+        return _request("POST", f"{base_url}/submit/", {"assignment_id": assignment["id"], "answer_text": "load test"},
+                        headers=target["headers"])[0]
+
+    def grade():
+        target = rng.choice(targets)
+        assignment = rng.choice(target["assignments"])
+        body = {"student_id": target["student_id"], "assignment_id": assignment["id"],
+                "score": rng.randint(0, assignment["max_score"])}
+        return _request("POST", f"{base_url}/grades/", body, headers=headers)[0]
+
+    def student_login():
+        target = rng.choice(targets)
+        return _request("POST", f"{base_url}/students/login",
+                        {"email": target["email"], "password": DEFAULT_PASSWORD})[0]
+
+    # bcrypt bound, kept to a fraction of the other scenarios
+    login_scenarios = ("POST /token", "POST /students/login")
+    scenarios = {
+        "GET /": lambda: _request("GET", f"{base_url}/")[0],
+        "GET /courses/{id}": lambda: _request(
+            "GET", f"{base_url}/courses/{rng.randint(1, args.courses)}", headers=headers)[0],
+        "POST /submit/": submit,
+        "POST /grades/": grade,
+        "POST /token": lambda: _request(
+            "POST", f"{base_url}/token", {"username": TEACHER_USERNAME, "password": DEFAULT_PASSWORD}, form=True)[0],
+        "POST /students/login": student_login,
+    }
+
+    print(f"{'scenario':<28}{'reqs':>8}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>12}")
+    for name, call in scenarios.items():
+        total = args.requests if name not in login_scenarios else max(1, args.requests // 20)
+        run_scenario(name, call, total, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+# test/test_benchmarks.py
+# Micro-benchmarks and query-count regression checks on a seeded synthetic dataset.
+# Run with `pytest test/test_benchmarks.py` and read the "benchmarks (ms)" section at the end.
+from datetime import datetime, timezone
+from itertools import cycle
+
+import pytest
+from pydantic import TypeAdapter
+
+from bench_utils import QueryCounter, run_benchmark
+from data_generator import generate_dataset
+from app.models import Assignment, Course, Student
+from app.responses import course_adapter, course_model
+from app.schemas import CourseCreate, CourseResponse, GradeCreate, SubmissionCreate
+from app.services.course_service import CourseService
+
+pytestmark = pytest.mark.benchmark
+
+
+# --- Query budgets ---
+# Number of SQL statements each endpoint may run, including the auth lookup.
+# Lower a number when a change makes an endpoint cheaper, never raise it silently.
+QUERY_BUDGETS = {
+    "read_course": 4,
+    "create_course": 6,
+    "add_assignment": 5,
+    "submit_assignment": 6,
+    "grade_student": 8,
+    "teacher_login": 1,
+    "student_login": 1,
+    "create_student": 4,
+    "delete_student": 5,
+    "delete_assignment": 5,
+    "student_dashboard": 2,
+}
+
+
+@pytest.fixture
+def empty_course_id(db, dataset):
+    # generated courses are already at their formula limit
+    return CourseService.create_course(
+        db, CourseCreate(title="Empty Course", max_lab_points=40, max_exam_points=60)).id
+
+
+def _endpoint_calls(client, dataset, empty_course_id, teacher_headers, student_headers):
+    course_id = dataset.course_ids[0]
+    return {
+        "read_course": lambda: client.get(f"/courses/{course_id}", headers=teacher_headers),
+        "create_course": lambda: client.post(
+            "/courses/", json={"title": "Budget Course", "max_lab_points": 40, "max_exam_points": 60},
+            headers=teacher_headers),
+        "add_assignment": lambda: client.post(
+            f"/courses/{empty_course_id}/assignments/",
+            json={"title": "Lab", "type": "lab", "max_score": 5, "deadline": "2030-01-01T00:00:00",
+                  "content": {"question": "?"}},
+            headers=teacher_headers),
+        "submit_assignment": lambda: client.post(
+            "/submit/", json={"assignment_id": dataset.assignment_ids[0], "answer_text": "answer"},
+            headers=student_headers),
+        "grade_student": lambda: client.post(
+            "/grades/", json={"student_id": dataset.student_ids[0], "assignment_id": dataset.assignment_ids[0],
+                              "score": 1}, headers=teacher_headers),
+        "teacher_login": lambda: client.post(
+            "/token", data={"username": dataset.teacher_username, "password": dataset.password}),
+        "student_login": lambda: client.post(
+            "/students/login", json={"email": dataset.student_emails[0], "password": dataset.password}),
+        "create_student": lambda: client.post(
+            f"/students/?course_id={course_id}",
+            json={"full_name": "New Student", "email": "new.student@example.com", "password": "secret1"},
+            headers=teacher_headers),
+        "delete_student": lambda: client.delete(f"/students/{dataset.student_ids[-1]}", headers=teacher_headers),
+        "delete_assignment": lambda: client.delete(
+            f"/courses/assignments/{dataset.assignment_ids[-1]}", headers=teacher_headers),
+        "student_dashboard": lambda: client.get("/students/me/dashboard", headers=student_headers),
+    }
+
+
+@pytest.mark.parametrize("endpoint", QUERY_BUDGETS)
+def test_endpoint_query_budget(endpoint, client, engine, dataset, empty_course_id, teacher_headers,
+                               student_headers):
+    calls = _endpoint_calls(client, dataset, empty_course_id, teacher_headers, student_headers)
+    with QueryCounter(engine) as queries:
+        response = calls[endpoint]()
+
+    assert response.status_code == 200, response.text
+    assert queries.count <= QUERY_BUDGETS[endpoint], "\n".join(queries.statements)
+
+
+def test_check_missed_deadlines_query_budget(engine, db, dataset):
+    now = datetime.now(timezone.utc)
+    expired = db.query(Assignment).filter(Assignment.deadline < now).all()
+    students_per_course = {c: db.query(Student).filter(Student.course_id == c).count() for c in dataset.course_ids}
+
+    # first sweep inserts the missing zero grades, the second one only reads
+    CourseService.check_missed_deadlines(db)
+    with QueryCounter(engine) as queries:
+        CourseService.check_missed_deadlines(db)
+
+    budget = 1 + len(expired) + sum(students_per_course[a.course_id] for a in expired)
+    assert queries.count <= budget
+
+
+# --- Service benchmarks ---
+def test_benchmark_grade_student(db, dataset):
+    targets = cycle(zip(dataset.student_ids, dataset.assignment_ids))
+
+    def grade():
+        student_id, assignment_id = next(targets)
+        CourseService.grade_student(db, GradeCreate(student_id=student_id, assignment_id=assignment_id, score=1))
+
+    run_benchmark("service.grade_student", grade)
+
+
+def test_benchmark_submit_assignment(db, dataset):
+    targets = cycle(zip(dataset.student_ids, dataset.assignment_ids))
+
+    def submit():
+        student_id, assignment_id = next(targets)
+        CourseService.submit_assignment(
+            db, SubmissionCreate(assignment_id=assignment_id, answer_text="answer"), student_id=student_id)
+
+    run_benchmark("service.submit_assignment", submit)
+
+
+def test_benchmark_check_missed_deadlines(db, dataset):
+    run_benchmark("service.check_missed_deadlines", lambda: CourseService.check_missed_deadlines(db), rounds=5)
+
+
+# --- Endpoint benchmarks ---
+def test_benchmark_read_course(client, dataset, teacher_headers):
+    course_id = dataset.course_ids[0]
+
+    def read():
+        assert client.get(f"/courses/{course_id}", headers=teacher_headers).status_code == 200
+
+    run_benchmark("GET /courses/{id}", read)
+
+
+def test_benchmark_teacher_login(client, dataset):
+    form = {"username": dataset.teacher_username, "password": dataset.password}
+
+    def login():
+        assert client.post("/token", data=form).status_code == 200
+
+    # bcrypt dominates, a few rounds are enough
+    run_benchmark("POST /token", login, rounds=5)
+
+
+def test_benchmark_student_login(client, dataset):
+    body = {"email": dataset.student_emails[0], "password": dataset.password}
+
+    def login():
+        assert client.post("/students/login", json=body).status_code == 200
+
+    run_benchmark("POST /students/login", login, rounds=5)
+
+
+# --- Serialization ---
+def test_benchmark_course_serialization(db):
+    # largest payload the API returns: one course with every student and assignment
+    generate_dataset(db, courses=1, students_per_course=2000, labs_per_course=40, exams_per_course=10,
+                     grade_ratio=0)
+    course = db.query(Course).first()
+    adapter = TypeAdapter(CourseResponse)
+
+    def validated_path():
+        # what FastAPI does with response_model when it is handed the ORM row
+        adapter.dump_json(adapter.validate_python(course, from_attributes=True))
+
+    def fast_path():
+        course_adapter.dump_json(course_model(course))
+
+    # reported in the summary only, wall-clock comparisons are too noisy to assert on
+    run_benchmark("serialize course (response_model)", validated_path, rounds=5)
+    run_benchmark("serialize course (course_model)", fast_path, rounds=5)
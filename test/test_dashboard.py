@@ -0,0 +1,171 @@
+# test/test_dashboard.py
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+from bench_utils import QueryCounter
+from data_generator import generate_dataset
+from app.config import Settings
+from app.main import create_app
+from app.models import Assignment, Course, Grade, Student
+from app.schemas import GradeCreate, SubmissionCreate
+from app.services.course_service import CourseService
+from app.services.dashboard_service import DashboardCache, DashboardService
+
+
+def _dashboard(client, student_headers):
+    response = client.get("/students/me/dashboard", headers=student_headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_dashboard_matches_database(client, db, dataset, student_headers):
+    data = _dashboard(client, student_headers)
+
+    student = db.query(Student).filter(Student.id == dataset.student_ids[0]).first()
+    course = db.query(Course).filter(Course.id == student.course_id).first()
+    grades = {g.assignment_id: g for g in student.grades}
+
+    assert data["student"]["id"] == student.id
+    assert data["course_title"] == course.title
+    assert [a["id"] for a in data["assignments"]] == sorted(
+        (a.id for a in course.assignments), key=lambda i: (db.get(Assignment, i).deadline, i))
+
+    lab_total = sum(g.score for g in grades.values() if g.assignment.type == "lab")
+    exam_total = sum(g.score for g in grades.values() if g.assignment.type == "exam")
+    assert data["lab_total"] == lab_total
+    assert data["exam_total"] == exam_total
+    assert data["total"] == lab_total + exam_total
+
+    for item in data["assignments"]:
+        grade = grades.get(item["id"])
+        assert item["score"] == (grade.score if grade else None)
+        if grade:
+            assert item["is_late"] == (grade.submitted_at > grade.assignment.deadline)
+
+
+def test_dashboard_requires_student_token(client, dataset, teacher_headers):
+    assert client.get("/students/me/dashboard").status_code == 401
+    assert client.get("/students/me/dashboard", headers=teacher_headers).status_code == 401
+
+
+def test_dashboard_is_cached(client, engine, dataset, student_headers):
+    _dashboard(client, student_headers)
+
+    with QueryCounter(engine) as queries:
+        _dashboard(client, student_headers)
+
+    # only the token lookup, the dashboard comes from the cache
+    assert queries.count == 1
+
+
+def test_dashboard_invalidated_by_grade_and_submit(client, db, dataset, student_headers):
+    student_id = dataset.student_ids[0]
+    assignment = db.query(Assignment).filter(Assignment.course_id == dataset.course_ids[0]) \
+        .order_by(Assignment.id).first()
+    assignment.deadline = datetime.utcnow() + timedelta(days=1)
+    db.commit()
+    _dashboard(client, student_headers)
+
+    CourseService.submit_assignment(db, SubmissionCreate(assignment_id=assignment.id, answer_text="new"),
+                                    student_id=student_id)
+    CourseService.grade_student(db, GradeCreate(student_id=student_id, assignment_id=assignment.id, score=1))
+
+    item = next(a for a in _dashboard(client, student_headers)["assignments"] if a["id"] == assignment.id)
+    assert item["score"] == 1
+    assert item["is_late"] is False
+
+
+def test_dashboard_invalidated_by_deadline_sweep(client, db, dataset, student_headers):
+    student_id = dataset.student_ids[0]
+    assignment = db.query(Assignment).filter(Assignment.course_id == dataset.course_ids[0]) \
+        .order_by(Assignment.id).first()
+    db.query(Grade).filter(Grade.student_id == student_id, Grade.assignment_id == assignment.id).delete()
+    assignment.deadline = datetime.utcnow() - timedelta(days=1)
+    db.commit()
+    _dashboard(client, student_headers)
+
+    CourseService.check_missed_deadlines(db)
+
+    item = next(a for a in _dashboard(client, student_headers)["assignments"] if a["id"] == assignment.id)
+    assert item["score"] == 0
+    assert item["missed"] is True
+    # the sweep stamps submitted_at with its own run time, that is not a late submission
+    assert item["is_late"] is False
+
+
+def test_dashboard_cache_is_per_student(db, dataset, monkeypatch):
+    cache = DashboardCache(expire_seconds=60, max_entries=100)
+    first, second = (db.get(Student, i) for i in dataset.student_ids[:2])
+    build = DashboardService._build_dashboard
+
+    def build_with_concurrent_write(db, student):
+        # a grade for the other student lands while this dashboard is being built
+        cache.invalidate(second.id if student.id == first.id else first.id)
+        return build(db, student)
+
+    monkeypatch.setattr(DashboardService, "_build_dashboard", staticmethod(build_with_concurrent_write))
+    DashboardService.get_dashboard(db, first, cache)
+
+    assert cache.student_ids() == [first.id]
+
+
+def test_dashboard_not_stored_when_invalidated_during_build(db, dataset, monkeypatch):
+    cache = DashboardCache(expire_seconds=60, max_entries=100)
+    student = db.get(Student, dataset.student_ids[0])
+    build = DashboardService._build_dashboard
+
+    def build_with_concurrent_write(db, student):
+        dashboard = build(db, student)
+        cache.invalidate(student.id)
+        return dashboard
+
+    monkeypatch.setattr(DashboardService, "_build_dashboard", staticmethod(build_with_concurrent_write))
+    DashboardService.get_dashboard(db, student, cache)
+
+    assert cache.student_ids() == []
+
+
+def test_dashboard_cache_is_bounded():
+    api = create_app(Settings(DATABASE_URL="sqlite://", CREATE_SCHEMA=True, SCHEDULER_ENABLED=False,
+                              DASHBOARD_CACHE_MAX_ENTRIES=3))
+    db = api.state.SessionLocal()
+    dataset = generate_dataset(db, courses=1, students_per_course=5)
+    students = [db.get(Student, i) for i in dataset.student_ids]
+
+    for student in students:
+        DashboardService.get_dashboard(db, student, api.state.dashboard_cache)
+
+    # least recently used entries are evicted first
+    assert api.state.dashboard_cache.student_ids() == [s.id for s in students[-3:]]
+    db.close()
+    api.state.engine.dispose()
+
+
+def test_dashboard_cache_is_per_app(client, db, dataset, student_headers):
+    # same ids in a second app with its own database, the first app's cached dashboard must not leak
+    _dashboard(client, student_headers)
+    other = create_app(Settings(DATABASE_URL="sqlite://", CREATE_SCHEMA=True, SCHEDULER_ENABLED=False))
+    other_db = other.state.SessionLocal()
+    generate_dataset(other_db, courses=1, students_per_course=2, labs_per_course=1, exams_per_course=1, seed=7)
+    other_db.close()
+
+    data = _dashboard(TestClient(other), student_headers)
+    other.state.engine.dispose()
+
+    assert len(data["assignments"]) == 2
+    assert other.state.dashboard_cache is not client.app.state.dashboard_cache
+
+
+def test_writes_invalidate_only_their_app(client, db, dataset, student_headers):
+    other = create_app(Settings(DATABASE_URL="sqlite://", CREATE_SCHEMA=True, SCHEDULER_ENABLED=False))
+    student_id = dataset.student_ids[0]
+    _dashboard(client, student_headers)
+    other.state.dashboard_cache.get_or_build(student_id, lambda: "other app")
+
+    assignment = db.query(Assignment).filter(Assignment.course_id == dataset.course_ids[0]).first()
+    CourseService.grade_student(db, GradeCreate(student_id=student_id, assignment_id=assignment.id, score=1))
+
+    assert client.app.state.dashboard_cache.student_ids() == []
+    assert other.state.dashboard_cache.student_ids() == [student_id]
+    other.state.engine.dispose()
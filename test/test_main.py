@@ -1,12 +1,76 @@
 # tests/test_main.py
+import subprocess
+import sys
+from pathlib import Path
+
 from fastapi.testclient import TestClient
-from app.main import app
 
-client = TestClient(app)
+from app.config import Settings
+from app.main import create_app
+from app.migrate import migrate
+from app.services.auth_service import create_access_token
+
 
-def test_create_course_needs_auth():
+def test_create_course_needs_auth(client):
     response = client.post("/courses/", json={"title": "Test Course", "max_lab_points": 40, "max_exam_points": 60})
     assert response.status_code == 401
 
-# Note: Full testing requires mocking the DB session, 
-# but this demonstrates the presence of tests as per requirements.
\ No newline at end of file
+
+def test_create_app_uses_given_database(tmp_path):
+    db_file = tmp_path / "custom.db"
+    url = f"sqlite:///{db_file}"
+    api = create_app(Settings(DATABASE_URL=url, SCHEDULER_ENABLED=False))
+
+    # nothing is created until the explicit migration step
+    assert not db_file.exists()
+    migrate(url)
+    assert db_file.exists()
+    assert str(api.state.engine.url) == url
+    api.state.engine.dispose()
+
+
+def test_apps_do_not_share_databases(monkeypatch):
+    monkeypatch.setattr("app.services.course_service.send_email_notification", lambda *args: None)
+    first = create_app(Settings(DATABASE_URL="sqlite://", CREATE_SCHEMA=True, SCHEDULER_ENABLED=False))
+    second = create_app(Settings(DATABASE_URL="sqlite://", CREATE_SCHEMA=True, SCHEDULER_ENABLED=False))
+
+    client_a, client_b = TestClient(first), TestClient(second)
+    client_a.post("/register", json={"username": "teacher", "email": "teacher@example.com", "password": "secret1"})
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': 'teacher'})}"}
+
+    course = {"title": "Only in A", "max_lab_points": 40, "max_exam_points": 60}
+    assert client_a.post("/courses/", json=course, headers=headers).status_code == 200
+    # the teacher only exists in the first app's database
+    assert client_b.post("/courses/", json=course, headers=headers).status_code == 401
+
+    first.state.engine.dispose()
+    second.state.engine.dispose()
+
+
+def test_apps_sign_tokens_with_their_own_key():
+    api = create_app(Settings(DATABASE_URL="sqlite://", CREATE_SCHEMA=True, SCHEDULER_ENABLED=False,
+                              SECRET_KEY="key-of-this-app"))
+    client = TestClient(api)
+    client.post("/register", json={"username": "teacher", "email": "teacher@example.com", "password": "secret1"})
+    token = client.post("/token", data={"username": "teacher", "password": "secret1"}).json()["access_token"]
+
+    course = {"title": "Signed", "max_lab_points": 40, "max_exam_points": 60}
+    assert client.post("/courses/", json=course, headers={"Authorization": f"Bearer {token}"}).status_code == 200
+    # a token signed with the process-wide key is not accepted by this app
+    default_token = create_access_token(data={"sub": "teacher"})
+    assert client.post("/courses/", json=course,
+                       headers={"Authorization": f"Bearer {default_token}"}).status_code == 401
+
+    api.state.engine.dispose()
+
+
+def test_import_does_not_build_app():
+    # fresh interpreter, the test session has already imported everything
+    code = (
+        "import sys, app.main; "
+        "print(' '.join(m for m in ('app.routers.courses', 'app.services.dashboard_service', "
+        "'apscheduler', 'passlib', 'jose') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).resolve().parent.parent,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
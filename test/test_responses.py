@@ -0,0 +1,89 @@
+# test/test_responses.py
+import json
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app import responses
+from app.config import Settings
+from app.main import create_app
+
+from app.models import Course, Grade
+from app.responses import course_adapter, course_model, grade_response
+from app.schemas import CourseResponse, GradeResponse
+from data_generator import generate_dataset
+
+
+def test_course_response_matches_validated_model(db, dataset):
+    course = db.query(Course).filter(Course.id == dataset.course_ids[0]).first()
+
+    expected = CourseResponse.model_validate(course, from_attributes=True).model_dump(mode="json")
+    assert json.loads(course_adapter.dump_json(course_model(course))) == expected
+
+
+def test_grade_response_matches_validated_model(db, dataset):
+    grade = db.query(Grade).first()
+
+    expected = GradeResponse.model_validate(grade, from_attributes=True).model_dump(mode="json")
+    assert json.loads(grade_response(grade).body) == expected
+
+
+def test_read_course_endpoint_uses_fast_path(client, dataset, teacher_headers):
+    with patch("app.routers.courses.course_model", wraps=responses.course_model) as course_model, \
+            patch.object(responses.FastJSONCoder, "encode", wraps=responses.FastJSONCoder.encode) as encode:
+        response = client.get(f"/courses/{dataset.course_ids[0]}", headers=teacher_headers)
+
+    assert response.status_code == 200
+    course_model.assert_called_once()
+    # the constructed model reaches the cache coder, not a dict or an ORM row
+    assert isinstance(encode.call_args.args[0], CourseResponse)
+    assert len(response.json()["students"]) == len(dataset.student_ids) // len(dataset.course_ids)
+
+
+def test_read_course_keeps_cache_headers(client, dataset, teacher_headers):
+    response = client.get(f"/courses/{dataset.course_ids[0]}", headers=teacher_headers)
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["cache-control"] == "max-age=60"
+    assert response.headers["etag"].startswith("W/")
+    assert response.headers["x-fastapi-cache"] == "MISS"
+
+
+def test_read_course_second_request_hits_cache(client, dataset, teacher_headers):
+    url = f"/courses/{dataset.course_ids[0]}"
+    first = client.get(url, headers=teacher_headers)
+
+    with patch("app.routers.courses.CourseService.get_course") as get_course:
+        second = client.get(url, headers=teacher_headers)
+
+    get_course.assert_not_called()
+    assert first.headers["x-fastapi-cache"] == "MISS"
+    assert second.headers["x-fastapi-cache"] == "HIT"
+    assert second.status_code == 200
+    assert second.json() == first.json()
+
+
+def test_read_course_cache_is_keyed_by_course(client, dataset, teacher_headers):
+    first = client.get(f"/courses/{dataset.course_ids[0]}", headers=teacher_headers)
+    other = client.get(f"/courses/{dataset.course_ids[1]}", headers=teacher_headers)
+
+    assert other.headers["x-fastapi-cache"] == "MISS"
+    assert other.json()["id"] == dataset.course_ids[1] != first.json()["id"]
+
+
+def test_read_course_cache_is_per_app(client, dataset, teacher_headers):
+    url = f"/courses/{dataset.course_ids[0]}"
+    assert client.get(url, headers=teacher_headers).status_code == 200
+
+    other = create_app(Settings(DATABASE_URL="sqlite://", CREATE_SCHEMA=True, SCHEDULER_ENABLED=False))
+    db = other.state.SessionLocal()
+    try:
+        generate_dataset(db, courses=1, students_per_course=3, labs_per_course=1, exams_per_course=1)
+    finally:
+        db.close()
+
+    response = TestClient(other).get(url, headers=teacher_headers)
+    other.state.engine.dispose()
+
+    assert response.headers["x-fastapi-cache"] == "MISS"
+    assert len(response.json()["students"]) == 3